@@ -1,160 +1,525 @@
-from collections import defaultdict, deque, Counter
-from models import Player, Move, State, Game, StandardNode, WinNode, LoopNode
+import sys
+from collections import Counter
+from models import (Player, Move, State, Game, StandardNode, WinNode, LoopNode,
+                    KIND_STANDARD, KIND_WIN, KIND_LOOP)
 
-# Map from State to its StandardNode (for detecting loops)
-state_to_node = {}
+try:
+    # Optional: compiles the backward-induction kernel to native code
+    import numpy as np
+    from numba import njit
+except ImportError:
+    njit = None
 
+def encode_state(state, rules):
+    """Pack a state into a single int, using the threshold as the digit base.
+
+    Players already store their hands in canonical (sorted) order, so equal
+    states always pack to the same id.
+    """
+    base = rules.threshold
+    a, b = state.curr_player.hands
+    c, d = state.next_player.hands
+    return ((a * base + b) * base + c) * base + d
+
+
+def decode_state(state_id, rules):
+    """Rebuild the State for an id produced by encode_state."""
+    base = rules.threshold
+    state_id, d = divmod(state_id, base)
+    state_id, c = divmod(state_id, base)
+    a, b = divmod(state_id, base)
+    return State(Player.of((a, b)), Player.of((c, d)))
+
+
+# Every attack move, shared by all states instead of rebuilt per call
+_ATTACKS = tuple(Move.attack(i, j) for i in range(2) for j in range(2))
+
+# Legal split moves, keyed by (hands, split_rule, threshold)
+_SPLITS = {}
 
-def generate_possible_moves(state, rules):
-    """Generate all possible Move objects from the current state."""
-    moves = []
-    me = state.curr_player
 
-    # Generate all possible attack moves
-    for i in range(2):
-        for j in range(2):
-            moves.append(Move.attack(i, j))
+def split_moves(hands, rules):
+    """Return the legal split moves for a hand configuration.
 
-    # Generate split moves based on split rule
-    total_fingers = sum(me.hands)
+    The result only depends on the hands and the split rule settings, so it
+    is computed once per combination and shared afterwards.
+    """
+    key = (hands, rules.split_rule, rules.threshold)
+    splits = _SPLITS.get(key)
+    if splits is not None:
+        return splits
+
+    splits = []
+    total_fingers = sum(hands)
 
     if rules.split_rule == 'restrictive':
         # Only split from 4-0 or 2-0
-        if me.hands in [(4, 0), (2, 0)]:
-            k = me.hands[0] // 2
-            moves.append(Move.split((k, k)))
+        if hands in [(4, 0), (2, 0)]:
+            k = hands[0] // 2
+            splits.append(Move.split((k, k)))
     else:
         # Generate all possible splits that preserve total fingers
         for i in range(total_fingers + 1):
             j = total_fingers - i
-            if i <= j and i != me.hands[0]:  # Avoid duplicates or no-ops
-                moves.append(Move.split((j, i)))
+            # Avoid duplicates, no-ops and hands that would already be dead
+            if i <= j < rules.threshold and i != hands[0]:
+                if rules.split_rule in ('change', 'free') and (j, i) == hands:
+                    # These rules require the split to change the state
+                    continue
+                splits.append(Move.split((j, i)))
+
+    splits = tuple(splits)
+    _SPLITS[key] = splits
+    return splits
+
+
+def generate_possible_moves(state, rules):
+    """Generate the legal Move objects from the current state.
+
+    Mirrors the checks in Move.apply, so the moves returned here can be
+    applied with Move.apply_unchecked.
+    """
+    me = state.curr_player
+    opp = state.next_player
 
+    # Attacks need a live hand on both sides
+    moves = [move for move in _ATTACKS
+             if me.hands[move.source_hand] != 0 and opp.hands[move.target_hand] != 0]
+    moves.extend(split_moves(me.hands, rules))
     return moves
 
 
 def generate_moves(state, rules):
     """Generate all legal moves and their resulting states."""
-    possible_moves = generate_possible_moves(state, rules)
-    move_state_pairs = []
+    # Deduplicate states, keeping the first move that reaches each one.
+    # Dicts preserve insertion order, so the move order is unchanged.
+    first_move = {}
+    for move in generate_possible_moves(state, rules):
+        first_move.setdefault(move.apply_unchecked(state, rules), move)
 
-    for move in possible_moves:
-        try:
-            next_state = move.apply(state, rules)
-            move_state_pairs.append((move, next_state))
-        except ValueError:
-            # Move is illegal, skip it
-            pass
+    return [(move, next_state) for next_state, move in first_move.items()]
 
-    # Deduplicate states (but keep the moves)
-    seen_states = {}
-    unique_pairs = []
-    for move, next_state in move_state_pairs:
-        if next_state not in seen_states:
-            seen_states[next_state] = move
-            unique_pairs.append((move, next_state))
 
-    return unique_pairs
+# Transition tables already built, keyed by the rule settings they depend on
+_transition_tables = {}
 
 
-def build_tree(state, rules):
-    """Build the game tree from a starting state using the new node structure."""
-    # Check if this state already has a node
-    if state in state_to_node:
-        # Return a LoopNode pointing to the existing node
-        return LoopNode(state_to_node[state])
+def build_transition_table(rules):
+    """Precompute every state and its successors for a rule set.
 
-    # Check if this is a terminal state
-    if state.is_terminal():
-        return WinNode(state, state.winner())
+    Enumerates all packed ids once, keeping only canonical ones (higher hand
+    first), so move generation runs a single time per state.
 
-    # Create a StandardNode for this state
-    node = StandardNode(state)
-    state_to_node[state] = node
+    Successors are stored in CSR form: the children of id are
+    child_idx[child_ptr[id]:child_ptr[id + 1]], reached by the moves at the
+    same positions in child_moves. Terminal and non-canonical ids have none.
 
-    # Generate all possible moves and next states
-    move_state_pairs = generate_moves(state, rules)
+    Returns:
+        (states, child_ptr, child_idx, child_moves): states[id] is the State
+        for a canonical id, None otherwise.
+    """
+    key = (rules.threshold, rules.modular, rules.split_rule)
+    if key in _transition_tables:
+        return _transition_tables[key]
 
-    # Recursively build the tree for each next state
-    for move, next_state in move_state_pairs:
-        next_node = build_tree(next_state, rules)
-        node.add_transition(move, next_node)
+    base = rules.threshold
+    n_states = base ** 4
+    states = [None] * n_states
 
-    return node
+    for state_id in range(n_states):
+        state = decode_state(state_id, rules)
+        if encode_state(state, rules) != state_id:
+            # Hands not in canonical order, another id covers this state
+            continue
+        states[state_id] = state
 
+    # Ids are visited in order, so appending directly yields CSR rows
+    child_ptr = [0]
+    child_idx = []
+    child_moves = []
+    for state in states:
+        if state is not None and not state.is_terminal():
+            for move, next_state in generate_moves(state, rules):
+                child_idx.append(encode_state(next_state, rules))
+                child_moves.append(move)
+        child_ptr.append(len(child_idx))
 
-UNKNOWN, WIN, LOSE, DRAW = 0, 1, 2, 3
+    table = (states, child_ptr, child_idx, child_moves)
+    _transition_tables[key] = table
+    return table
 
 
-def classify_positions_graph(all_nodes):
-    """Classify all nodes in the graph using iterative backward induction."""
-    # Build parent relationships
-    parents = defaultdict(set)
-    for node in all_nodes:
-        if isinstance(node, StandardNode):
-            for _move, next_node in node.transitions:
-                # Resolve LoopNodes to their actual targets
-                target = next_node.points_to if isinstance(next_node, LoopNode) else next_node
-                parents[target].add(node)
+def build_tree(state, rules):
+    """Build the game tree from a starting state using the new node structure.
+
+    Uses an explicit stack instead of recursion, so deep graphs cannot hit
+    the interpreter's recursion limit. Children are pushed in reverse so
+    states are discovered in the same order as a recursive DFS. Successors
+    come from the precomputed transition table.
+    """
+    states, child_ptr, child_idx, child_moves = build_transition_table(rules)
+    root = None
+
+    # Map from packed state id to its StandardNode (for detecting loops).
+    # Local to this call so repeated builds never see each other's nodes.
+    state_to_node = {}
+
+    # Stack of (parent node, move, state id) still to be attached
+    stack = [(None, None, encode_state(state, rules))]
+    while stack:
+        parent, move, state_id = stack.pop()
+
+        if state_id in state_to_node:
+            # Already explored: point back at the existing node
+            node = LoopNode(state_to_node[state_id])
+        elif states[state_id].is_terminal():
+            state = states[state_id]
+            node = WinNode(state, state.winner())
+        else:
+            # Create a StandardNode for this state and queue its moves
+            node = StandardNode(states[state_id])
+            state_to_node[state_id] = node
+            for k in reversed(range(child_ptr[state_id], child_ptr[state_id + 1])):
+                stack.append((node, child_moves[k], child_idx[k]))
+
+        if parent is None:
+            root = node
+        else:
+            parent.add_transition(move, node)
 
-    # Initialize status map
-    status = {node: UNKNOWN for node in all_nodes if isinstance(node, StandardNode)}
-    remaining_children = {}
+    return root
 
-    for node in all_nodes:
-        if isinstance(node, StandardNode):
-            # Count children, resolving LoopNodes
-            child_count = 0
-            for _move, next_node in node.transitions:
-                target = next_node.points_to if isinstance(next_node, LoopNode) else next_node
-                if isinstance(target, StandardNode):
-                    child_count += 1
-            remaining_children[node] = child_count
 
-    # Start with terminal nodes
-    q = deque()
-    for node in all_nodes:
-        if isinstance(node, WinNode):
-            # Winner already won, so current player (who would move) has lost
-            status[node] = LOSE
-            q.append(node)
-        elif isinstance(node, StandardNode) and not node.transitions:
-            # No moves available is a loss
-            status[node] = LOSE
-            q.append(node)
+UNKNOWN, WIN, LOSE, DRAW = 0, 1, 2, 3
 
-    # Backward induction
-    while q:
-        node = q.popleft()
+
+def _backward_induction(parent_ptr, parent_idx, remaining_children, status, queue, tail):
+    """Propagate WIN/LOSE from the seeded queue back through the parents.
+
+    Works on flat integer arrays only (parents in CSR form, queue as a
+    preallocated buffer with manual head/tail), so it can be compiled with
+    numba when that is installed.
+    """
+    head = 0
+    while head < tail:
+        node = queue[head]
+        head += 1
         st = status[node]
 
-        for parent in parents.get(node, []):
+        for k in range(parent_ptr[node], parent_ptr[node + 1]):
+            parent = parent_idx[k]
             if status[parent] != UNKNOWN:
                 continue
 
             if st == LOSE:
                 # Parent can win by moving to this losing state
                 status[parent] = WIN
-                q.append(parent)
+                queue[tail] = parent
+                tail += 1
             elif st == WIN:
                 # Parent's opponent wins, so one option eliminated
                 remaining_children[parent] -= 1
                 if remaining_children[parent] == 0:
                     # All moves lead to opponent winning
                     status[parent] = LOSE
-                    q.append(parent)
+                    queue[tail] = parent
+                    tail += 1
+
+
+if njit is not None:
+    _backward_induction = njit(cache=True)(_backward_induction)
+
+
+def _invert_edges(n, edges):
+    """Build the CSR parent arrays for (parent, child) edges over n nodes.
+
+    Counts each child's in-degree, turns the counts into row offsets with a
+    running sum, then drops every parent into its child's row.
+    """
+    parent_ptr = [0] * (n + 1)
+    for _parent, child in edges:
+        parent_ptr[child + 1] += 1
+    for i in range(n):
+        parent_ptr[i + 1] += parent_ptr[i]
+
+    parent_idx = [0] * len(edges)
+    fill = parent_ptr[:n]
+    for parent, child in edges:
+        parent_idx[fill[child]] = parent
+        fill[child] += 1
+    return parent_ptr, parent_idx
+
+
+def _propagate(n, edges, remaining_children, status):
+    """Finish classifying n numbered nodes by backward induction.
+
+    Args:
+        n: Number of nodes
+        edges: (parent, child) index pairs
+        remaining_children: Per node, how many children are not yet WIN
+            (only those can still turn the node into a LOSE)
+        status: Per node, WIN/LOSE if already known, UNKNOWN otherwise
+
+    Returns:
+        The final status list, with nodes that never resolve marked DRAW
+    """
+    # Build parent relationships as CSR: parents of i are
+    # parent_idx[parent_ptr[i]:parent_ptr[i + 1]]
+    parent_ptr, parent_idx = _invert_edges(n, edges)
+
+    # Every already-classified node seeds the queue
+    queue = [0] * n
+    tail = 0
+    for i in range(n):
+        if status[i] != UNKNOWN:
+            queue[tail] = i
+            tail += 1
+
+    if njit is not None:
+        parent_ptr = np.asarray(parent_ptr, dtype=np.int32)
+        parent_idx = np.asarray(parent_idx, dtype=np.int32)
+        remaining_children = np.asarray(remaining_children, dtype=np.int16)
+        status = np.asarray(status, dtype=np.uint8)
+        queue = np.asarray(queue, dtype=np.int32)
+
+    # Backward induction
+    _backward_induction(parent_ptr, parent_idx, remaining_children, status, queue, tail)
 
     # Mark remaining UNKNOWN nodes as DRAW
-    for node in status:
-        if status[node] == UNKNOWN:
-            status[node] = DRAW
+    return [DRAW if st == UNKNOWN else int(st) for st in status]
+
+
+def classify_positions_graph(all_nodes):
+    """Classify all nodes in the graph using iterative backward induction."""
+    # Number the real nodes; LoopNodes share the index of their target
+    graph_nodes = [node for node in all_nodes if node.kind != KIND_LOOP]
+    index = {node: i for i, node in enumerate(graph_nodes)}
+    n = len(graph_nodes)
+
+    # Collect parent -> child edges and count each node's StandardNode children
+    edges = []
+    remaining_children = [0] * n
+    for i, node in enumerate(graph_nodes):
+        if node.kind == KIND_STANDARD:
+            for next_node in node.next_list:
+                # Resolve LoopNodes to their actual targets
+                target = next_node.points_to if next_node.kind == KIND_LOOP else next_node
+                edges.append((i, index[target]))
+                if target.kind == KIND_STANDARD:
+                    remaining_children[i] += 1
+
+    # Start with terminal nodes
+    status = [UNKNOWN] * n
+    for i, node in enumerate(graph_nodes):
+        if node.kind == KIND_WIN or not node.next_list:
+            # A WinNode means the player to move has already lost, and
+            # having no moves available is a loss too
+            status[i] = LOSE
+
+    status_map = dict(zip(graph_nodes, _propagate(n, edges, remaining_children, status)))
 
     # Also map LoopNodes to their target's status
     for node in all_nodes:
-        if isinstance(node, LoopNode):
-            status[node] = status[node.points_to]
-
-    return status
+        if node.kind == KIND_LOOP:
+            status_map[node] = status_map[node.points_to]
+
+    return status_map
+
+
+def solve_states(state, rules):
+    """Classify every state reachable from `state` without building nodes.
+
+    Fuses exploration and classification: an iterative post-order DFS over
+    the transition table settles each state as soon as its children are
+    done. Only states left undecided there (those on or behind a cycle) go
+    through the backward-induction pass, so parents are never built for
+    the rest of the graph.
+
+    Returns:
+        Dict mapping each reachable State to WIN, LOSE or DRAW
+    """
+    states, child_ptr, child_idx, _child_moves = build_transition_table(rules)
+    root_id = encode_state(state, rules)
+
+    # UNKNOWN marks states still on the stack or not decided yet
+    status = {root_id: UNKNOWN}
+    pending = []
+
+    # Stack of [state id, offset of the next child to visit]
+    stack = [[root_id, child_ptr[root_id]]]
+    while stack:
+        top = stack[-1]
+        state_id, k = top
+        if k < child_ptr[state_id + 1]:
+            top[1] = k + 1
+            child = child_idx[k]
+            if child not in status:
+                status[child] = UNKNOWN
+                stack.append([child, child_ptr[child]])
+            continue
+
+        # All children visited: settle this state if they allow it
+        stack.pop()
+        children = child_idx[child_ptr[state_id]:child_ptr[state_id + 1]]
+        if any(status[child] == LOSE for child in children):
+            # Moving to a losing state wins
+            status[state_id] = WIN
+        elif all(status[child] == WIN for child in children):
+            # Every move hands the opponent a win (or there are no moves)
+            status[state_id] = LOSE
+        else:
+            pending.append(state_id)
+
+    # Backward induction restricted to the undecided states
+    index = {state_id: i for i, state_id in enumerate(pending)}
+    n = len(pending)
+    edges = []
+    remaining_children = [0] * n
+    pending_status = [UNKNOWN] * n
+    for i, state_id in enumerate(pending):
+        for child in child_idx[child_ptr[state_id]:child_ptr[state_id + 1]]:
+            st = status[child]
+            if st == LOSE:
+                pending_status[i] = WIN
+            elif st == UNKNOWN:
+                edges.append((i, index[child]))
+                remaining_children[i] += 1
+        if pending_status[i] == UNKNOWN and remaining_children[i] == 0:
+            pending_status[i] = LOSE
+
+    for state_id, st in zip(pending, _propagate(n, edges, remaining_children, pending_status)):
+        status[state_id] = st
+
+    return {states[state_id]: st for state_id, st in status.items()}
+
+
+# Status of a position for the player who moved into it, and how much the
+# player to move prefers each outcome
+_NEGATE = {WIN: LOSE, LOSE: WIN, DRAW: DRAW}
+_RANK = {LOSE: 0, DRAW: 1, WIN: 2}
+
+
+def _move_order_key(states, child_id):
+    """Sort key that tries moves leaving the opponent fewest live hands first."""
+    return sum(1 for hand in states[child_id].curr_player.hands if hand)
+
+
+def _settle_cycle(group, memo):
+    """Resolve a closed group of provisional DRAWs and memoize the results.
+
+    `group` holds (state id, children) for states whose DRAW relied on a
+    repetition inside the group. Every child outside it already has its
+    final status in `memo`, so backward induction over just the group
+    gives the exact statuses.
+    """
+    index = {state_id: i for i, (state_id, _children) in enumerate(group)}
+    n = len(group)
+    edges = []
+    remaining_children = [0] * n
+    status = [UNKNOWN] * n
+    for i, (_state_id, children) in enumerate(group):
+        for child in children:
+            if child in index:
+                edges.append((i, index[child]))
+                remaining_children[i] += 1
+            elif memo[child] == LOSE:
+                status[i] = WIN
+            elif memo[child] == DRAW:
+                # Can never be eliminated, so this state is never a LOSE
+                remaining_children[i] += 1
+        if status[i] == UNKNOWN and remaining_children[i] == 0:
+            status[i] = LOSE
+
+    for (state_id, _children), st in zip(group, _propagate(n, edges, remaining_children, status)):
+        memo[state_id] = st
+
+
+def solve(state, rules):
+    """Find the status of a single state, searching only what it needs.
+
+    Negamax over the transition table with a memo acting as transposition
+    table. Children that kill a hand are tried first, and a state stops
+    searching as soon as one winning move is found, so most of the graph
+    is never visited when only the root's value is wanted.
+
+    A state still being searched counts as a provisional DRAW (the game
+    would repeat). WIN and LOSE results never depend on that and are
+    memoized at once. DRAWs that relied on a repetition are held back, in
+    the manner of Tarjan's SCC algorithm, until the whole cycle has been
+    searched, then settled together by backward induction. Every state is
+    searched at most once.
+
+    Returns:
+        WIN, LOSE or DRAW for the player to move in `state`
+    """
+    states, child_ptr, child_idx, _child_moves = build_transition_table(rules)
+    memo = {}
+    order = {}         # State id -> discovery index
+    searching = set()  # States currently on the search stack
+    held = []          # (state id, children) of unsettled DRAWs, in order
+    held_ids = set()
+
+    def push(state_id):
+        children = sorted(child_idx[child_ptr[state_id]:child_ptr[state_id + 1]],
+                          key=lambda child: _move_order_key(states, child))
+        order[state_id] = len(order)
+        searching.add(state_id)
+        # [state id, ordered children, next child, best status so far,
+        #  earliest discovery index relied on, len(held) on entry]
+        stack.append([state_id, children, 0, LOSE, order[state_id], len(held)])
+
+    stack = []
+    push(encode_state(state, rules))
+    while True:
+        frame = stack[-1]
+        state_id, children, pos, best, low, mark = frame
+
+        if best != WIN and pos < len(children):
+            frame[2] = pos + 1
+            child = children[pos]
+            if child in memo:
+                value = _NEGATE[memo[child]]
+            elif child in searching or child in held_ids:
+                # Repetition: provisionally a DRAW until the cycle is settled
+                value = DRAW
+                frame[4] = min(low, order[child])
+            else:
+                push(child)
+                continue
+            if _RANK[value] > _RANK[best]:
+                frame[3] = value
+            continue
+
+        # Every child searched (or a win found): finish this state
+        stack.pop()
+        searching.discard(state_id)
+        if low < order[state_id]:
+            # Part of a cycle through a state further up the stack
+            if best == DRAW:
+                held.append((state_id, children))
+                held_ids.add(state_id)
+            else:
+                memo[state_id] = best
+        else:
+            # First state of its cycle: everything held since is settled now
+            group = held[mark:]
+            del held[mark:]
+            if best == DRAW:
+                group.append((state_id, children))
+            else:
+                memo[state_id] = best
+            if group:
+                held_ids.difference_update(held_id for held_id, _children in group)
+                _settle_cycle(group, memo)
+
+        if not stack:
+            return memo[state_id]
+
+        parent = stack[-1]
+        value = _NEGATE[memo[state_id]] if state_id in memo else DRAW
+        if _RANK[value] > _RANK[parent[3]]:
+            parent[3] = value
+        parent[4] = min(parent[4], low)
 
 
 def pretty_status(code):
@@ -163,18 +528,18 @@ def pretty_status(code):
 
 
 def collect_all_nodes(root_node, visited=None):
-    """Collect all unique nodes in the tree."""
+    """Collect all unique nodes in the tree (iteratively, no recursion)."""
     if visited is None:
         visited = set()
 
-    if root_node in visited:
-        return visited
-
-    visited.add(root_node)
-
-    if isinstance(root_node, StandardNode):
-        for move, next_node in root_node.transitions:
-            collect_all_nodes(next_node, visited)
+    stack = [root_node]
+    while stack:
+        node = stack.pop()
+        if node in visited:
+            continue
+        visited.add(node)
+        if node.kind == KIND_STANDARD:
+            stack.extend(node.next_list)
 
     return visited
 
@@ -188,7 +553,7 @@ def best_moves_from(node, status_map):
     drawing_moves = []
     other_moves = []
 
-    for move, next_node in node.transitions:
+    for move, next_node in zip(node.move_list, node.next_list):
         next_status = status_map.get(next_node, UNKNOWN)
 
         if next_status == LOSE:
@@ -205,12 +570,47 @@ def best_moves_from(node, status_map):
     return other_moves
 
 
+# Split rules understood by Game
+SPLIT_RULES = ('restrictive', 'change', 'free', 'suicide')
+
+
+def check_solvers(thresholds=range(2, 8)):
+    """Cross-check the classifiers on every rule variant.
+
+    For each threshold, modular setting and split rule, every state reachable
+    from the standard start must get the same status from solve_states and
+    from solve (each state solved on its own, so every cycle shape gets
+    settled from every entry point) as from classify_positions_graph.
+    Raises AssertionError on the first mismatch.
+    """
+    root_state = State(Player.of((1, 1)), Player.of((1, 1)))
+    for threshold in thresholds:
+        for modular in (False, True):
+            for split_rule in SPLIT_RULES:
+                rules = Game(threshold=threshold, modular=modular, split_rule=split_rule)
+                variant = f"threshold={threshold}, modular={modular}, split_rule={split_rule!r}"
+
+                all_nodes = collect_all_nodes(build_tree(root_state, rules))
+                status_map = classify_positions_graph(all_nodes)
+                expected = {node.state: status_map[node] for node in all_nodes if node.kind != KIND_LOOP}
+
+                fused = solve_states(root_state, rules)
+                assert fused == expected, f"solve_states disagrees with classify_positions_graph ({variant})"
+
+                for state, st in expected.items():
+                    got = solve(state, rules)
+                    assert got == st, (f"solve({state}) gives {pretty_status(got)}, expected "
+                                       f"{pretty_status(st)} ({variant})")
+
+                print(f"ok  {variant}: {len(expected)} states")
+
+
 def main():
     # Initialize game rules
     rules = Game(threshold=5, modular=False, split_rule='restrictive')
 
     # Initialize starting state
-    root_state = State(Player((1, 1)), Player((1, 1)))
+    root_state = State(Player.of((1, 1)), Player.of((1, 1)))
 
     # Build the game tree
     root_node = build_tree(root_state, rules)
@@ -245,4 +645,7 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    if sys.argv[1:] == ['--check']:
+        check_solvers()
+    else:
+        main()
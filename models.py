@@ -4,13 +4,19 @@ Supports various rule variations including modular arithmetic, different split r
 multi-player, and 'alien' configurations.
 """
 
-from typing import Tuple, Optional, List
+from typing import Dict, Tuple, Optional, List
 from dataclasses import dataclass
 
 
+# Interned Player instances, keyed by hands tuple (see Player.of)
+_PLAYER_POOL: Dict[Tuple[int, int], 'Player'] = {}
+
+
 class Player:
     """Represents a player's hand state in Chopsticks."""
 
+    __slots__ = ('hands', '_hash')
+
     def __init__(self, hands: Tuple[int, int]):
         """
         Initialize a player with finger counts on each hand.
@@ -19,7 +25,9 @@ class Player:
             hands: Tuple of (hand1_fingers, hand2_fingers)
         """
         # Always store higher number first for canonical representation
-        self.hands = tuple(sorted(hands, reverse=True))
+        a, b = hands
+        self.hands: Tuple[int, int] = (a, b) if a >= b else (b, a)
+        self._hash = hash(self.hands)
 
     def __str__(self) -> str:
         """Pretty print as 'x-y' format (higher number first)."""
@@ -28,13 +36,30 @@ class Player:
     def __repr__(self) -> str:
         return f"Player({self.hands[0]}-{self.hands[1]})"
 
-    def __eq__(self, other) -> bool:
+    @staticmethod
+    def of(hands: Tuple[int, int]) -> 'Player':
+        """
+        Return the shared Player for these hands, creating it on first use.
+
+        Players are immutable and there are only a handful of distinct ones,
+        so interning them keeps allocations out of move application.
+        """
+        player = _PLAYER_POOL.get(hands)
+        if player is None:
+            player = Player(hands)
+            # Register under both orderings so either lookup hits
+            _PLAYER_POOL[hands] = _PLAYER_POOL[player.hands] = player
+        return player
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, Player):
             return False
         return self.hands == other.hands
 
     def __hash__(self) -> int:
-        return hash(self.hands)
+        return self._hash
 
     def is_dead(self) -> bool:
         """Check if player has lost (both hands at 0)."""
@@ -45,7 +70,7 @@ class Player:
         return Player(self.hands)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Move:
     """
     Represents a move in Chopsticks (Attack or Split).
@@ -64,10 +89,10 @@ class Move:
         - Attack: a<source><target> (e.g., a12 means attack with hand 1 to opponent's hand 2)
         - Split: s<hand1><hand2> (e.g., s22 means split to 2-2)
         """
-        if self.move_type == 'attack':
+        if self.move_type == 'attack' and self.source_hand is not None and self.target_hand is not None:
             # Format: a<source+1><target+1> (1-indexed for display)
             return f"a{self.source_hand + 1}{self.target_hand + 1}"
-        elif self.move_type == 'split':
+        elif self.move_type == 'split' and self.result_hands is not None:
             # Format: s<hand1><hand2>
             return f"s{self.result_hands[0]}{self.result_hands[1]}"
         elif self.move_type == 'pass':
@@ -91,51 +116,77 @@ class Move:
         Raises:
             ValueError: If the move is illegal
         """
+        self._validate(state, rules)
+        return self.apply_unchecked(state, rules)
+
+    def apply_unchecked(self, state: 'State', rules: 'Game') -> 'State':
+        """
+        Apply a move already known to be legal, skipping the legality checks.
+
+        Used by move generation, which only emits legal moves.
+        """
         me = state.curr_player
         opp = state.next_player
 
         if self.move_type == 'attack':
-            # Check legality: both hands must be alive
-            if self.source_hand < 0 or self.source_hand > 1:
-                raise ValueError(f"Invalid source hand index: {self.source_hand}")
-            if self.target_hand < 0 or self.target_hand > 1:
-                raise ValueError(f"Invalid target hand index: {self.target_hand}")
-            if me.hands[self.source_hand] == 0:
-                raise ValueError(f"Cannot attack with dead hand (hand {self.source_hand} has 0 fingers)")
-            if opp.hands[self.target_hand] == 0:
-                raise ValueError(f"Cannot attack dead hand (opponent's hand {self.target_hand} has 0 fingers)")
-
-            # Attack: add attacking hand's value to opponent's hand
-            new_opp_hands = list(opp.hands)
-            new_opp_hands[self.target_hand] = opp.hands[self.target_hand] + me.hands[self.source_hand]
-
-            # Apply threshold rule (modular or standard)
-            if rules.modular:
-                # Modular arithmetic: only die if exactly at threshold
-                if new_opp_hands[self.target_hand] == rules.threshold:
-                    new_opp_hands[self.target_hand] = 0
-                elif new_opp_hands[self.target_hand] > rules.threshold:
-                    new_opp_hands[self.target_hand] %= rules.threshold
+            source, target = self.source_hand, self.target_hand
+            assert source is not None and target is not None
+
+            # Attack: add attacking hand's value to opponent's hand, with the
+            # threshold rule (modular or standard) already folded into the table
+            new_fingers = rules.attack_table[opp.hands[target]][me.hands[source]]
+            if target == 0:
+                new_opp_hands = (new_fingers, opp.hands[1])
             else:
-                # Standard: die if >= threshold
-                if new_opp_hands[self.target_hand] >= rules.threshold:
-                    new_opp_hands[self.target_hand] = 0
+                new_opp_hands = (opp.hands[0], new_fingers)
 
             # Swap players for next turn
-            return State(Player(tuple(new_opp_hands)), Player(me.hands))
+            return State(Player.of(new_opp_hands), Player.of(me.hands))
 
         elif self.move_type == 'split':
+            assert self.result_hands is not None
+
+            # Split: redistribute own fingers
+            return State(Player.of(opp.hands), Player.of(self.result_hands))
+
+        # Pass: just swap players
+        return State(Player.of(opp.hands), Player.of(me.hands))
+
+    def _validate(self, state: 'State', rules: 'Game') -> None:
+        """Raise ValueError if this move is illegal in the given state."""
+        me = state.curr_player
+        opp = state.next_player
+
+        if self.move_type == 'attack':
+            # Check legality: both hands must be alive
+            source, target = self.source_hand, self.target_hand
+            if source is None or source < 0 or source > 1:
+                raise ValueError(f"Invalid source hand index: {source}")
+            if target is None or target < 0 or target > 1:
+                raise ValueError(f"Invalid target hand index: {target}")
+            if me.hands[source] == 0:
+                raise ValueError(f"Cannot attack with dead hand (hand {source} has 0 fingers)")
+            if opp.hands[target] == 0:
+                raise ValueError(f"Cannot attack dead hand (opponent's hand {target} has 0 fingers)")
+
+        elif self.move_type == 'split':
+            result = self.result_hands
+            if result is None:
+                raise ValueError("Split move has no resulting hands")
+
             # Check legality: total fingers must remain unchanged
             total_current = sum(me.hands)
-            total_new = sum(self.result_hands)
+            total_new = sum(result)
             if total_current != total_new:
-                raise ValueError(f"Split must preserve total fingers: {me.hands} -> {self.result_hands}")
+                raise ValueError(f"Split must preserve total fingers: {me.hands} -> {result}")
+            if max(result) >= rules.threshold:
+                raise ValueError(f"Split cannot create a hand at or above threshold: {result}")
 
             # Check split rule constraints
             if rules.split_rule == 'change':
                 # State must change
-                if Player(self.result_hands) == me:
-                    raise ValueError(f"Split must change state: {me.hands} -> {self.result_hands}")
+                if Player.of(result) == me:
+                    raise ValueError(f"Split must change state: {me.hands} -> {result}")
             elif rules.split_rule == 'restrictive':
                 # Only allowed from 4-0 or 2-0
                 if me.hands not in [(4, 0), (2, 0)]:
@@ -145,17 +196,10 @@ class Move:
                 pass
             elif rules.split_rule == 'free':
                 # Any split allowed (but state must still change for canonical rules)
-                if Player(self.result_hands) == me:
-                    raise ValueError(f"Split must change state: {me.hands} -> {self.result_hands}")
+                if Player.of(result) == me:
+                    raise ValueError(f"Split must change state: {me.hands} -> {result}")
 
-            # Split: redistribute own fingers
-            return State(Player(opp.hands), Player(self.result_hands))
-
-        elif self.move_type == 'pass':
-            # Pass: just swap players
-            return State(Player(opp.hands), Player(me.hands))
-
-        else:
+        elif self.move_type != 'pass':
             raise ValueError(f"Unknown move type: {self.move_type}")
 
     @staticmethod
@@ -180,6 +224,8 @@ class State:
     Just the player positions, no rules.
     """
 
+    __slots__ = ('curr_player', 'next_player', '_hash')
+
     def __init__(self, curr_player: Player, next_player: Player):
         """
         Initialize a game state.
@@ -190,6 +236,8 @@ class State:
         """
         self.curr_player = curr_player
         self.next_player = next_player
+        # States are hashed on every dict/set probe during the search
+        self._hash = hash((curr_player, next_player))
 
     def __str__(self) -> str:
         """Pretty print as 'x-y/x-y (P1)' format from the report."""
@@ -198,14 +246,14 @@ class State:
     def __repr__(self) -> str:
         return f"State({self.curr_player}/{self.next_player})"
 
-    def __eq__(self, other) -> bool:
+    def __eq__(self, other: object) -> bool:
         if not isinstance(other, State):
             return False
         return (self.curr_player == other.curr_player and
                 self.next_player == other.next_player)
 
     def __hash__(self) -> int:
-        return hash((self.curr_player, self.next_player))
+        return self._hash
 
     def is_terminal(self) -> bool:
         """Check if game is over."""
@@ -236,6 +284,8 @@ class Game:
     - Alien configurations (different hand counts, finger capacities)
     """
 
+    __slots__ = ('threshold', 'modular', 'split_rule', 'attack_table')
+
     def __init__(self, threshold: int = 5, modular: bool = False, split_rule: str = 'restrictive'):
         """
         Initialize game rules.
@@ -253,36 +303,76 @@ class Game:
         self.modular = modular
         self.split_rule = split_rule
 
+        # attack_table[target][attacker]: fingers left on the target hand
+        # after an attack, for every pair of live hand values
+        self.attack_table = tuple(
+            tuple(self._hand_after_attack(target + attacker) for attacker in range(threshold))
+            for target in range(threshold)
+        )
+
+    def _hand_after_attack(self, fingers: int) -> int:
+        """Apply the threshold rule to a hand that now holds `fingers`."""
+        if self.modular:
+            # Modular arithmetic: only die if exactly at threshold
+            if fingers == self.threshold:
+                return 0
+            elif fingers > self.threshold:
+                return fingers % self.threshold
+        else:
+            # Standard: die if >= threshold
+            if fingers >= self.threshold:
+                return 0
+        return fingers
+
 
 # Game tree node types
 
+# Integer tags stored on every node, so hot loops can dispatch on node type
+# with an int compare instead of isinstance
+KIND_STANDARD, KIND_WIN, KIND_LOOP = 0, 1, 2
+
+
 class StandardNode:
     """A continuing game state with possible moves and their resulting nodes."""
 
+    __slots__ = ('kind', 'state', 'move_list', 'next_list')
+
     def __init__(self, state: State):
+        self.kind = KIND_STANDARD
         self.state = state
-        self.transitions: List[Tuple[Move, 'Node']] = []  # List of (Move, resulting Node) pairs
+        # Parallel lists: move_list[i] leads to next_list[i]
+        self.move_list: List[Move] = []
+        self.next_list: List['Node'] = []
+
+    @property
+    def transitions(self) -> List[Tuple[Move, 'Node']]:
+        """(Move, resulting Node) pairs, built from the parallel lists."""
+        return list(zip(self.move_list, self.next_list))
 
-    def add_transition(self, move: Move, node: 'Node'):
+    def add_transition(self, move: Move, node: 'Node') -> None:
         """Add a move and its resulting node to the transitions."""
-        self.transitions.append((move, node))
+        self.move_list.append(move)
+        self.next_list.append(node)
 
     def __str__(self) -> str:
         return f"StandardNode({self.state})"
 
     def __repr__(self) -> str:
-        return f"StandardNode({self.state}, {len(self.transitions)} moves)"
+        return f"StandardNode({self.state}, {len(self.move_list)} moves)"
 
 
 class WinNode:
     """A terminal game state where one player has won."""
 
+    __slots__ = ('kind', 'state', 'winner')
+
     def __init__(self, state: State, winner: str):
         """
         Args:
             state: The terminal game state
             winner: "curr_player" or "next_player"
         """
+        self.kind = KIND_WIN
         self.state = state
         self.winner = winner
 
@@ -296,11 +386,14 @@ class WinNode:
 class LoopNode:
     """A node representing a game state that has already been explored."""
 
+    __slots__ = ('kind', 'points_to')
+
     def __init__(self, points_to: StandardNode):
         """
         Args:
             points_to: The StandardNode that was already created for this state
         """
+        self.kind = KIND_LOOP
         self.points_to = points_to
 
     def __str__(self) -> str:
@@ -1,209 +1,321 @@
-import matplotlib.pyplot as plt
-import networkx as nx
-from collections import deque
-from models import Player, Move, State, Game, StandardNode, WinNode, LoopNode
-from game_theory import build_tree, collect_all_nodes, classify_positions_graph, pretty_status, UNKNOWN, WIN, LOSE, DRAW
+import os
+import shutil
+import subprocess
+from multiprocessing import Process
+import numpy as np
+from dataclasses import dataclass, field
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+from models import Player, State, Game, KIND_STANDARD, KIND_WIN, KIND_LOOP
+from game_theory import build_tree, collect_all_nodes, classify_positions_graph, pretty_status, WIN, LOSE
+
+# Graphviz's dot executable, used for the plain decision tree when installed
+DOT = shutil.which('dot')
+
+# Statuses whose subtrees are not expanded when stop_at_win_lose is set
+_TERMINAL = frozenset((WIN, LOSE))
+
+# Above this many nodes the matplotlib renderers skip node and move labels
+# unless asked for them: they overlap into noise anyway and formatting and
+# laying out the text dominates draw time
+_LABEL_LIMIT = 150
+
+
+def _resolve(node):
+    """Return the node a LoopNode points to, or the node itself."""
+    return node.points_to if node.kind == KIND_LOOP else node
+
+
+def _node_coords(data, x_scale, y_scale):
+    """Return an (N, 2) array of node positions, row i for node id i."""
+    return np.column_stack((np.asarray(data.columns, dtype=float) * x_scale,
+                            np.asarray(data.depths, dtype=float) * -y_scale)).reshape(-1, 2)
+
+
+def _draw_graph(ax, coords, edges, labels, node_colors, node_size, font_size, margin=(1, 1),
+                hexagons=()):
+    """Draw nodes, edges and labels as a handful of batched artists.
+
+    coords comes from _node_coords and node_colors follows the same node id
+    order; edges are (parent_id, child_id) pairs. Nodes whose ids are in
+    hexagons are drawn as hexagons instead of circles; labels may be empty.
+    The axis limits are set from the node positions plus margin, so the
+    figure can be saved without tight_layout or bbox_inches='tight', each of
+    which costs a full draw.
+    """
+    edge_ids = np.asarray(edges, dtype=np.intp).reshape(-1, 2)
+    ax.add_collection(LineCollection(coords[edge_ids], colors='black', linewidths=1, zorder=1))
+    colors = np.asarray(node_colors)
+    hexagon = np.zeros(len(coords), dtype=bool)
+    hexagon[list(hexagons)] = True
+    ax.scatter(coords[~hexagon, 0], coords[~hexagon, 1], c=colors[~hexagon], s=node_size, zorder=2)
+    if hexagon.any():
+        ax.scatter(coords[hexagon, 0], coords[hexagon, 1], c=colors[hexagon], s=node_size,
+                   marker='h', zorder=2)
+    if len(coords):
+        (min_x, min_y), (max_x, max_y) = coords.min(axis=0), coords.max(axis=0)
+        ax.set_xlim(min_x - margin[0], max_x + margin[0])
+        ax.set_ylim(min_y - margin[1], max_y + margin[1])
+    for node_id, label in labels.items():
+        x, y = coords[node_id]
+        ax.text(x, y, label, ha='center', va='center',
+                fontsize=font_size, fontweight='bold', zorder=3)
+    ax.set_axis_off()
+
+
+@dataclass
+class VizData:
+    """Nodes and edges reached by one depth-limited walk of the tree.
+
+    Node ids are indices into kinds, hands, winners, statuses, parents,
+    depths and columns. Only plain values are kept, never the nodes
+    themselves, so the record stays small and pickles without walking the
+    game graph. hands holds (current player's hands, next player's hands)
+    and winners the WinNode winner, each None where it does not apply.
+    parents holds the node each one was first reached from (None for the
+    root), and columns its x position in the tidy layout of that spanning
+    tree. statuses is None for nodes missing from the status map.
+    """
+    depth_limit: int
+    kinds: list = field(default_factory=list)
+    hands: list = field(default_factory=list)
+    winners: list = field(default_factory=list)
+    statuses: list = field(default_factory=list)
+    parents: list = field(default_factory=list)
+    depths: list = field(default_factory=list)
+    columns: list = field(default_factory=list)
+    edges: list = field(default_factory=list)  # (parent_id, child_id)
+    moves: list = field(default_factory=list)  # move taken along each edge
+    truncated: dict = field(default_factory=dict)  # node_id -> children left out by max_nodes
+
+
+def _tidy_columns(parents):
+    """Lay out the spanning tree given by parents, returning an x per node.
+
+    Leaves take consecutive columns in depth-first order and every parent is
+    centred over its first and last child, so subtrees occupy disjoint
+    intervals and nodes on the same level never overlap. Ids must be in
+    discovery order (each parent before its children), as _collect_viz_data
+    produces them.
+    """
+    n = len(parents)
+    children = [[] for _ in range(n)]
+    for node_id in range(1, n):
+        children[parents[node_id]].append(node_id)
+
+    columns = [0.0] * n
+    next_leaf = 0
+    stack = [0] if n else []
+    while stack:
+        node_id = stack.pop()
+        if children[node_id]:
+            stack.extend(reversed(children[node_id]))
+        else:
+            columns[node_id] = float(next_leaf)
+            next_leaf += 1
 
-def visualize_decision_tree(root_node, status_map, depth_limit=4, stop_at_win_lose=True):
-    """Visualize the decision tree with limited depth to keep it readable.
+    # Children have larger ids than their parent, so a reverse sweep places
+    # every subtree before the node above it
+    for node_id in range(n - 1, -1, -1):
+        kids = children[node_id]
+        if kids:
+            columns[node_id] = (columns[kids[0]] + columns[kids[-1]]) / 2
+    return columns
+
+
+def _collect_viz_data(root_node, status_map, depth_limit, stop_at_win_lose, max_nodes=2000):
+    """Walk the tree breadth-first up to depth_limit and record what to draw.
 
     Args:
         root_node: The root node of the tree
         status_map: Map of nodes to their WIN/LOSE/DRAW status
         depth_limit: Maximum depth to explore
         stop_at_win_lose: If True, don't explore children of WIN/LOSE nodes
-    """
-    G = nx.DiGraph()
-    pos = {}
-    labels = {}
-    node_colors = []
-    node_shapes = {}
+        max_nodes: Stop placing new nodes once this many have been placed;
+            parents that lost children to the cap are listed in truncated
 
-    # Track node IDs
+    Raises:
+        ValueError: If max_nodes is less than 1, which would leave out the root
+    """
+    if max_nodes < 1:
+        raise ValueError(f"max_nodes must be at least 1, got {max_nodes}")
+    data = VizData(depth_limit)
     node_id_map = {}
-    next_id = [0]
 
-    def get_node_id(node):
-        # Resolve LoopNodes to their actual target
-        actual_node = node.points_to if isinstance(node, LoopNode) else node
-        if actual_node not in node_id_map:
-            node_id_map[actual_node] = next_id[0]
-            next_id[0] += 1
-        return node_id_map[actual_node]
+    # Only StandardNodes above the depth limit have children to show; with
+    # stop_at_win_lose, nodes already classified WIN or LOSE are not expanded
+    if stop_at_win_lose:
+        def explore(node, depth, status):
+            return depth < depth_limit and node.kind == KIND_STANDARD and status not in _TERMINAL
+    else:
+        def explore(node, depth, status):
+            return depth < depth_limit and node.kind == KIND_STANDARD
 
-    # BFS to traverse tree with depth tracking
-    queue = deque([(root_node, 0, 0, 0)])  # (node, depth, x_pos, parent_id)
-    visited = set()
-    x_positions = {0: [0]}  # Track x positions at each depth
+    # Breadth-first over a plain list with a read index, so every node is
+    # first reached at its shallowest depth without deque overhead
+    queue = [(root_node, 0, None, None)]
+    head = 0
 
-    while queue:
-        node, depth, x_hint, parent_id = queue.popleft()
+    while head < len(queue):
+        node, depth, parent_id, move = queue[head]
+        head += 1
 
         if depth > depth_limit:
             continue
 
-        # Resolve LoopNodes to their actual target
-        actual_node = node.points_to if isinstance(node, LoopNode) else node
-        node_id = get_node_id(actual_node)
-
-        # Determine x position
-        if depth not in x_positions:
-            x_positions[depth] = []
-
-        if node_id not in pos:
-            # Find next available x position at this depth
-            x_pos = len(x_positions[depth])
-            x_positions[depth].append(x_pos)
-            pos[node_id] = (x_pos, -depth)
-
-        # Add to graph
-        if node_id not in visited:
-            visited.add(node_id)
-
-            # Create label (use actual_node)
-            if isinstance(actual_node, StandardNode):
-                state = actual_node.state
-                label = f"{node_id}\n{state.curr_player.hands}\nvs\n{state.next_player.hands}"
-                node_shapes[node_id] = 'o'  # circle
-            elif isinstance(actual_node, WinNode):
-                state = actual_node.state
-                winner = actual_node.winner
-                label = f"{node_id}\nWIN\n{winner}"
-                node_shapes[node_id] = 's'  # square
-            else:
-                label = f"{node_id}\n?"
-                node_shapes[node_id] = 'o'
+        actual_node = _resolve(node)
+        node_id = node_id_map.get(actual_node)
+        if node_id is not None:
+            # Already placed, but still record the edge from this parent
+            data.edges.append((parent_id, node_id))
+            data.moves.append(move)
+            continue
+        if len(data.kinds) >= max_nodes:
+            data.truncated[parent_id] = data.truncated.get(parent_id, 0) + 1
+            continue
 
-            labels[node_id] = label
-            G.add_node(node_id)
-
-            # Add edge from parent
-            if parent_id is not None:
-                G.add_edge(parent_id, node_id)
-
-            # Process children - only if not a terminal node or winning/losing position
-            # Don't explore beyond WinNodes or StandardNodes classified as WIN/LOSE (if enabled)
-            should_explore = False
-            if isinstance(actual_node, StandardNode) and depth < depth_limit:
-                if stop_at_win_lose:
-                    node_status = status_map.get(actual_node, UNKNOWN)
-                    # Only explore if the node is DRAW or UNKNOWN, not WIN or LOSE
-                    if node_status not in [WIN, LOSE]:
-                        should_explore = True
-                else:
-                    # Explore all StandardNodes regardless of status
-                    should_explore = True
-
-            if should_explore:
-                for i, (move, next_node) in enumerate(actual_node.transitions):
-                    queue.append((next_node, depth + 1, x_hint + i, node_id))
+        node_id = len(data.kinds)
+        node_id_map[actual_node] = node_id
+        # Looked up once here and reused for both exploring and drawing
+        status = status_map.get(actual_node)
+        kind = actual_node.kind
+        data.kinds.append(kind)
+        if kind == KIND_STANDARD:
+            state = actual_node.state
+            data.hands.append((state.curr_player.hands, state.next_player.hands))
         else:
-            # Node already visited, but still add edge from parent
-            if parent_id is not None:
-                G.add_edge(parent_id, node_id)
-
-    # Draw the graph
-    plt.figure(figsize=(20, 12))
-
-    # Draw nodes with different colors based on type
-    for node_id in G.nodes():
-        if node_id in node_id_map.values():
-            # Reverse lookup to get actual node
-            actual_node = next(k for k, v in node_id_map.items() if v == node_id)
-            if isinstance(actual_node, StandardNode):
-                node_colors.append('lightblue')
-            elif isinstance(actual_node, WinNode):
-                node_colors.append('lightgreen')
-            else:
-                node_colors.append('gray')
+            data.hands.append(None)
+        data.winners.append(actual_node.winner if kind == KIND_WIN else None)
+        data.statuses.append(status)
+        data.parents.append(parent_id)
+        data.depths.append(depth)
+
+        if parent_id is not None:
+            data.edges.append((parent_id, node_id))
+            data.moves.append(move)
 
-    nx.draw(G, pos, labels=labels, with_labels=True,
-            node_color=node_colors, node_size=2000,
-            font_size=8, font_weight='bold',
-            arrows=True, arrowsize=20, arrowstyle='->')
+        if explore(actual_node, depth, status):
+            for move, next_node in zip(actual_node.move_list, actual_node.next_list):
+                queue.append((next_node, depth + 1, node_id, move))
 
-    plt.title(f"Chopsticks Decision Tree (depth limit: {depth_limit})\nBlue=Standard, Green=Win (loops point to actual nodes)",
-              fontsize=14, fontweight='bold')
-    plt.tight_layout()
-    plt.savefig('decision_tree_visualization.png', dpi=150, bbox_inches='tight')
-    print("Saved visualization to decision_tree_visualization.png")
-    plt.close()
+    data.columns = _tidy_columns(data.parents)
+    return data
 
 
-def visualize_with_status(root_node, status_map, depth_limit=3, stop_at_win_lose=True):
-    """Visualize tree with game-theoretic status (WIN/LOSE/DRAW).
+def _show_labels(data, with_labels):
+    """Resolve a renderer's with_labels argument; None means only for small trees."""
+    return len(data.kinds) <= _LABEL_LIMIT if with_labels is None else with_labels
 
-    Args:
-        root_node: The root node of the tree
-        status_map: Map of nodes to their WIN/LOSE/DRAW status
-        depth_limit: Maximum depth to explore
-        stop_at_win_lose: If True, don't explore children of WIN/LOSE nodes
+
+def _decision_tree_nodes(data, with_labels=True):
+    """Yield (node_id, label, shape, color) for each node of the decision tree view.
+
+    label is None when with_labels is false, so no label text is formatted.
     """
-    G = nx.DiGraph()
-    pos = {}
-    labels = {}
-    node_colors = []
-    edge_labels = {}
+    for node_id, (kind, hands, winner) in enumerate(zip(data.kinds, data.hands, data.winners)):
+        label = None
+        if kind == KIND_STANDARD:
+            if with_labels:
+                label = f"{node_id}\n{hands[0]}\nvs\n{hands[1]}"
+            shape, color = 'ellipse', 'lightblue'
+        elif kind == KIND_WIN:
+            if with_labels:
+                label = f"{node_id}\nWIN\n{winner}"
+            shape, color = 'box', 'lightgreen'
+        else:
+            if with_labels:
+                label = f"{node_id}\n?"
+            shape, color = 'ellipse', 'gray'
+        count = data.truncated.get(node_id)
+        if count is not None:
+            if with_labels:
+                label += f"\n...{count} more"
+            shape = 'hexagon'
+        yield node_id, label, shape, color
 
-    node_id_map = {}
-    next_id = [0]
 
-    def get_node_id(node):
-        # Resolve LoopNodes to their actual target
-        actual_node = node.points_to if isinstance(node, LoopNode) else node
-        if actual_node not in node_id_map:
-            node_id_map[actual_node] = next_id[0]
-            next_id[0] += 1
-        return node_id_map[actual_node]
+def _render_dot(data, name, with_labels):
+    """Write the decision tree to name.dot line by line and run dot on it.
 
-    queue = deque([(root_node, 0, None, None)])
-    visited = set()
-    level_counts = {}
+    Labels are formatted as they are written, so nothing per node is kept
+    in memory beyond VizData itself.
+    """
+    with open(f'{name}.dot', 'w') as f:
+        f.write('digraph {\n')
+        f.write(f'  graph [label="Chopsticks Decision Tree (depth limit: {data.depth_limit})" '
+                'labelloc=t nodesep=0.2 rankdir=TB ranksep=0.4]\n')
+        for node_id, label, shape, color in _decision_tree_nodes(data, with_labels):
+            label = label.replace('\n', '\\n') if with_labels else ''
+            f.write(f'  {node_id} [label="{label}" fillcolor={color} shape={shape} style=filled]\n')
+        for u, v in data.edges:
+            f.write(f'  {u} -> {v}\n')
+        f.write('}\n')
+    subprocess.run([DOT, '-Tsvg', f'{name}.dot', '-o', f'{name}.svg'], check=True)
+
+
+def visualize_decision_tree(data, with_labels=None):
+    """Draw the decision tree collected by _collect_viz_data, labelled by node id.
 
-    while queue:
-        node, depth, parent_id, move = queue.popleft()
+    Args:
+        data: VizData from _collect_viz_data
+        with_labels: Whether to label nodes; None labels them through dot,
+            or through matplotlib for trees of at most _LABEL_LIMIT nodes
+    """
+    if DOT is not None:
+        # dot lays out layered graphs natively and is far faster than
+        # drawing thousands of nodes through matplotlib
+        _render_dot(data, 'decision_tree_visualization', with_labels is not False)
+        print("Saved visualization to decision_tree_visualization.svg")
+        return
+
+    show_labels = _show_labels(data, with_labels)
+    labels = {}
+    node_colors = []
+    for node_id, label, _shape, color in _decision_tree_nodes(data, show_labels):
+        if show_labels:
+            labels[node_id] = label
+        node_colors.append(color)
 
-        if depth > depth_limit:
-            continue
+    coords = _node_coords(data, 1, 1)
+    # Widen the figure with the layout so nodes keep their spacing
+    fig = Figure(figsize=(max(20, 0.8 * (max(data.columns, default=0) + 1)), 12))
+    ax = fig.add_subplot()
+    fig.subplots_adjust(left=0.01, right=0.99, bottom=0.01, top=0.93)
+    _draw_graph(ax, coords, data.edges, labels, node_colors, node_size=2000, font_size=8,
+                hexagons=data.truncated)
 
-        # Resolve LoopNodes to their actual target
-        actual_node = node.points_to if isinstance(node, LoopNode) else node
-        node_id = get_node_id(actual_node)
-
-        if node_id in visited:
-            # Still add edge if from different parent
-            if parent_id is not None:
-                edge = (parent_id, node_id)
-                if move:
-                    edge_labels[edge] = str(move)
-                G.add_edge(parent_id, node_id)
-            continue
+    ax.set_title(f"Chopsticks Decision Tree (depth limit: {data.depth_limit})\nBlue=Standard, Green=Win (loops point to actual nodes)",
+                 fontsize=14, fontweight='bold')
+    fig.savefig('decision_tree_visualization.svg')
+    print("Saved visualization to decision_tree_visualization.svg")
 
-        visited.add(node_id)
 
-        # Position nodes
-        if depth not in level_counts:
-            level_counts[depth] = 0
-        x_pos = level_counts[depth]
-        level_counts[depth] += 1
-        pos[node_id] = (x_pos * 3, -depth * 2)
+def visualize_with_status(data, with_labels=None):
+    """Draw the tree collected by _collect_viz_data with game-theoretic status (WIN/LOSE/DRAW).
 
-        # Create label with status (use actual_node)
-        status = status_map.get(actual_node, "?")
-        if isinstance(actual_node, StandardNode):
-            state = actual_node.state
-            status_str = pretty_status(status) if isinstance(status, int) else str(status)
-            label = f"{state.curr_player.hands} vs {state.next_player.hands}\n[{status_str}]"
-        elif isinstance(actual_node, WinNode):
-            label = f"WIN: {actual_node.winner}"
-        else:
-            label = "?"
+    Args:
+        data: VizData from _collect_viz_data
+        with_labels: Whether to label nodes and moves; None labels trees of
+            at most _LABEL_LIMIT nodes
+    """
+    show_labels = _show_labels(data, with_labels)
+    labels = {}
+    node_colors = []
 
-        labels[node_id] = label
-        G.add_node(node_id)
+    for node_id, (kind, hands, winner, status) in enumerate(
+            zip(data.kinds, data.hands, data.winners, data.statuses)):
+        # Create label with status
+        if show_labels:
+            if kind == KIND_STANDARD:
+                status_str = pretty_status(status) if status is not None else "?"
+                labels[node_id] = f"{hands[0]} vs {hands[1]}\n[{status_str}]"
+            elif kind == KIND_WIN:
+                labels[node_id] = f"WIN: {winner}"
+            else:
+                labels[node_id] = "?"
 
         # Color based on status
-        if isinstance(status, int):
+        if status is not None:
             if status == 1:  # WIN
                 node_colors.append('green')
             elif status == 2:  # LOSE
@@ -213,56 +325,37 @@ def visualize_with_status(root_node, status_map, depth_limit=3, stop_at_win_lose
             else:
                 node_colors.append('lightgray')
         else:
-            if isinstance(actual_node, WinNode):
+            if kind == KIND_WIN:
                 node_colors.append('lightgreen')
             else:
                 node_colors.append('lightblue')
 
-        # Add edge from parent
-        if parent_id is not None:
-            edge = (parent_id, node_id)
-            if move:
-                edge_labels[edge] = str(move)
-            G.add_edge(parent_id, node_id)
-
-        # Process children - only if not a terminal node or winning/losing position
-        # Don't explore beyond WinNodes or StandardNodes classified as WIN/LOSE (if enabled)
-        should_explore = False
-        if isinstance(actual_node, StandardNode) and depth < depth_limit:
-            if stop_at_win_lose:
-                node_status = status_map.get(actual_node, UNKNOWN)
-                # Only explore if the node is DRAW or UNKNOWN, not WIN or LOSE
-                if node_status not in [WIN, LOSE]:
-                    should_explore = True
-            else:
-                # Explore all StandardNodes regardless of status
-                should_explore = True
+    if show_labels:
+        for node_id, count in data.truncated.items():
+            labels[node_id] += f"\n...{count} more"
 
-        if should_explore:
-            for move, next_node in actual_node.transitions:
-                queue.append((next_node, depth + 1, node_id, move))
-
-    # Draw
-    plt.figure(figsize=(24, 14))
-    nx.draw(G, pos, labels=labels, with_labels=True,
-            node_color=node_colors, node_size=3000,
-            font_size=7, font_weight='bold',
-            arrows=True, arrowsize=15, arrowstyle='->')
+    coords = _node_coords(data, 3, 2)
+    fig = Figure(figsize=(max(24, 1.2 * (max(data.columns, default=0) + 1)), 14))
+    ax = fig.add_subplot()
+    fig.subplots_adjust(left=0.01, right=0.99, bottom=0.01, top=0.94)
+    _draw_graph(ax, coords, data.edges, labels, node_colors, node_size=3000, font_size=7, margin=(2, 1),
+                hexagons=data.truncated)
 
-    nx.draw_networkx_edge_labels(G, pos, edge_labels, font_size=6)
+    if show_labels:
+        midpoints = coords[np.asarray(data.edges, dtype=np.intp).reshape(-1, 2)].mean(axis=1)
+        for (x, y), move in zip(midpoints, data.moves):
+            ax.text(x, y, str(move), ha='center', va='center', fontsize=6)
 
-    plt.title("Chopsticks Decision Tree with Game Status\nGreen=WIN, Red=LOSE, Yellow=DRAW, Orange=LOOP",
-              fontsize=14, fontweight='bold')
-    plt.tight_layout()
-    plt.savefig('decision_tree_with_status.png', dpi=150, bbox_inches='tight')
-    print("Saved visualization to decision_tree_with_status.png")
-    plt.close()
+    ax.set_title("Chopsticks Decision Tree with Game Status\nGreen=WIN, Red=LOSE, Yellow=DRAW, Orange=LOOP",
+                 fontsize=14, fontweight='bold')
+    fig.savefig('decision_tree_with_status.svg')
+    print("Saved visualization to decision_tree_with_status.svg")
 
 
 if __name__ == "__main__":
     # Initialize game
     rules = Game(threshold=5, modular=False, split_rule='restrictive')
-    root_state = State(Player((1, 1)), Player((1, 1)))
+    root_state = State(Player.of((1, 1)), Player.of((1, 1)))
 
     print("Building game tree...")
     root_node = build_tree(root_state, rules)
@@ -276,9 +369,26 @@ if __name__ == "__main__":
 
     print("\nGenerating visualizations...")
     depth = 13
-    # Generate with stop_at_win_lose=True (default - cleaner view)
-    visualize_decision_tree(root_node, status_map, depth_limit=depth, stop_at_win_lose=True)
-    visualize_with_status(root_node, status_map, depth_limit=depth, stop_at_win_lose=True)
-
-    print("\nDone! Check the PNG files.")
+    # Generate with stop_at_win_lose=True (default - cleaner view); both
+    # images are drawn from the same walk of the tree, in separate processes
+    # when there is more than one CPU since rendering is CPU-bound. VizData
+    # holds no nodes, so it pickles cheaply if the platform spawns rather
+    # than forks.
+    data = _collect_viz_data(root_node, status_map, depth_limit=depth, stop_at_win_lose=True)
+    if (os.cpu_count() or 1) > 1:
+        renderers = [Process(target=render, args=(data,), name=render.__name__)
+                     for render in (visualize_decision_tree, visualize_with_status)]
+        for p in renderers:
+            p.start()
+        for p in renderers:
+            p.join()
+        # The worker has already printed its traceback; fail here too
+        failed = [p.name for p in renderers if p.exitcode != 0]
+        if failed:
+            raise RuntimeError(f"Rendering failed in {', '.join(failed)}")
+    else:
+        visualize_decision_tree(data)
+        visualize_with_status(data)
+
+    print("\nDone! Check the SVG files.")
     print("To see full tree including children of WIN/LOSE nodes, set stop_at_win_lose=False")